@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Bulk import employees from a CSV or JSON file
+
+Columns: first_name, last_name, email (required), phone, role, department,
+position. Writes credentials.csv with the new login IDs and temporary
+passwords, and errors.csv listing every row that was skipped.
+"""
+
+import sys
+import os
+import argparse
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import (app, db, Company, import_employees, read_import_rows, csv_text,
+                 presence_board, report_versions, IMPORT_CREDENTIALS_HEADER, IMPORT_ERRORS_HEADER)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Bulk import employees')
+    parser.add_argument('file', help='CSV or JSON file of employees')
+    parser.add_argument('--company', required=True, help='company code to import into')
+    parser.add_argument('--out-dir', default='.', help='where to write credentials.csv and errors.csv')
+    args = parser.parse_args()
+
+    with app.app_context():
+        company = Company.query.filter_by(code=args.company).first()
+        if not company:
+            print(f"❌ No company with code {args.company}")
+            sys.exit(1)
+
+        print(f"🔄 Importing employees from {args.file} into {company.name}...")
+        try:
+            with open(args.file, 'rb') as stream:
+                credentials, errors = import_employees(company, read_import_rows(stream, args.file))
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ Import failed: {e}")
+            sys.exit(1)
+
+        presence_board.invalidate(company.id)
+        report_versions.bump(company.id)
+
+        os.makedirs(args.out_dir, exist_ok=True)
+        for name, header, rows in (('credentials.csv', IMPORT_CREDENTIALS_HEADER, credentials),
+                                   ('errors.csv', IMPORT_ERRORS_HEADER, errors)):
+            with open(os.path.join(args.out_dir, name), 'w', newline='') as output:
+                output.write(csv_text(header, rows))
+
+        print(f"✅ Imported {len(credentials)} employee(s), skipped {len(errors)} row(s)")
+        print(f"   Credentials and errors written to {os.path.abspath(args.out_dir)}")
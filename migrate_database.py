@@ -1,86 +1,224 @@
 #!/usr/bin/env python3
 """
-Database migration script to add new profile functionality columns
+Database migration script for Dayflow HRMS
+
+Running it without arguments brings an existing database up to date by
+applying any pending versioned migrations. Existing data is never dropped.
+Use --reset to recreate the schema from scratch with default test data.
 """
 
 import sys
 import os
+import argparse
+from datetime import datetime
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from sqlalchemy import inspect, func
+
 from app import app, db
 
-def migrate_database():
-    """Add new columns and tables for comprehensive profile functionality"""
-    
+# Tracks which versioned migrations have been applied to this database
+schema_version = db.Table(
+    'schema_version',
+    db.metadata,
+    db.Column('version', db.Integer, primary_key=True, autoincrement=False),
+    db.Column('description', db.String(200), nullable=False),
+    db.Column('applied_at', db.DateTime, nullable=False),
+)
+
+def create_missing_indexes(*table_names):
+    """Create any index declared on the models that the database is missing"""
+    inspector = inspect(db.engine)
+    for table_name in table_names:
+        table = db.metadata.tables[table_name]
+        existing = {index['name'] for index in inspector.get_indexes(table_name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(db.engine)
+                print(f"   ✅ Created index {index.name} on {table_name}")
+
+def check_duplicate_attendance():
+    """Refuse to add the unique attendance index while duplicate days exist"""
+    from app import Attendance
+
+    duplicates = db.session.query(
+        Attendance.employee_id, Attendance.date, func.count(Attendance.id)
+    ).group_by(Attendance.employee_id, Attendance.date).having(func.count(Attendance.id) > 1).all()
+
+    if duplicates:
+        print("   ❌ Duplicate attendance rows found (employee_id, date, rows):")
+        for employee_id, day, count in duplicates[:20]:
+            print(f"      {employee_id}, {day}, {count}")
+        raise RuntimeError('Resolve duplicate attendance rows before applying this migration')
+
+def migration_001_lookup_indexes():
+    check_duplicate_attendance()
+    create_missing_indexes('user', 'attendance', 'leave_request', 'salary_info')
+
+def migration_002_attendance_summaries():
+    # The summary tables themselves were created by create_all(); backfill them
+    from app import rebuild_attendance_summaries
+
+    monthly, daily = rebuild_attendance_summaries()
+    print(f"   ✅ Backfilled {monthly} monthly and {daily} daily attendance summaries")
+
+def migration_003_list_pagination_indexes():
+    create_missing_indexes('attendance', 'leave_request')
+
+def migration_004_avatar_thumbnails():
+    # Re-encode pictures uploaded before thumbnails existed; originals are left on disk
+    from app import User, store_avatar, AVATAR_PREFIX
+
+    converted = 0
+    users = User.query.filter(User.profile_picture.isnot(None),
+                              ~User.profile_picture.startswith(AVATAR_PREFIX)).all()
+    for user in users:
+        path = os.path.join(app.config['UPLOAD_FOLDER'], user.profile_picture)
+        try:
+            with open(path, 'rb') as f:
+                user.profile_picture = store_avatar(f)
+            converted += 1
+        except (OSError, ValueError) as e:
+            print(f"   ⚠️  Kept {user.profile_picture} for {user.login_id}: {e}")
+    db.session.commit()
+    print(f"   ✅ Created thumbnails for {converted} profile picture(s)")
+
+# Versioned migrations, applied in order. Append new entries; never edit applied ones.
+# New tables are created by create_all(); migrations cover indexes on existing tables and backfills.
+MIGRATIONS = [
+    (1, 'Composite indexes for attendance and leave lookups', migration_001_lookup_indexes),
+    (2, 'Attendance summary tables', migration_002_attendance_summaries),
+    (3, 'Indexes for attendance and time-off list pagination', migration_003_list_pagination_indexes),
+    (4, 'Profile picture thumbnails', migration_004_avatar_thumbnails),
+]
+
+def applied_versions():
+    rows = db.session.execute(db.select(schema_version.c.version)).scalars()
+    return set(rows)
+
+def record_version(version, description):
+    db.session.execute(schema_version.insert().values(
+        version=version,
+        description=description,
+        applied_at=datetime.utcnow()
+    ))
+    db.session.commit()
+
+def upgrade_database():
+    """Apply pending versioned migrations without touching existing data"""
+
     with app.app_context():
         print("🔄 Starting database migration...")
-        
+
+        fresh_database = not inspect(db.engine).has_table('user')
+
+        # create_all only creates tables that do not exist yet
+        db.create_all()
+
+        if fresh_database:
+            # New tables already carry every index, so just stamp them
+            for version, description, _ in MIGRATIONS:
+                record_version(version, description)
+            print("\nCreating default test data...")
+            create_default_data()
+            print("\n✅ Fresh database created at schema version", MIGRATIONS[-1][0])
+            return
+
+        done = applied_versions()
+        pending = [m for m in MIGRATIONS if m[0] not in done]
+
+        if not pending:
+            print("\n✅ Database is up to date")
+            return
+
+        for version, description, migrate in pending:
+            print(f"\n{version}. {description}...")
+            try:
+                migrate()
+                record_version(version, description)
+            except Exception as e:
+                db.session.rollback()
+                print(f"\n❌ Migration {version} failed: {e}")
+                return
+
+        print("\n✅ Database migration completed successfully!")
+
+def create_default_data():
+    """Create the default company and test users"""
+    from app import Company, User
+    from werkzeug.security import generate_password_hash
+
+    # Create default company
+    company = Company(name="Dayflow Technologies", code="DT")
+    db.session.add(company)
+    db.session.flush()
+
+    # Create admin user
+    admin_user = User(
+        login_id="DTAD20241001",
+        email="admin@dayflow.com",
+        password_hash=generate_password_hash("admin123"),
+        first_name="Admin",
+        last_name="User",
+        role="admin",
+        company_id=company.id,
+        department="IT",
+        position="System Administrator",
+        must_change_password=False
+    )
+    db.session.add(admin_user)
+
+    # Create test employee
+    employee_user = User(
+        login_id="DTEM20241001",
+        email="employee@dayflow.com",
+        password_hash=generate_password_hash("emp123"),
+        first_name="Test",
+        last_name="Employee",
+        role="employee",
+        company_id=company.id,
+        department="Development",
+        position="Software Developer",
+        must_change_password=False
+    )
+    db.session.add(employee_user)
+
+    db.session.commit()
+
+    print("   ✅ Default admin user created: DTAD20241001 / admin123")
+    print("   ✅ Default employee user created: DTEM20241001 / emp123")
+
+def reset_database():
+    """Drop all tables and recreate them with default test data"""
+
+    with app.app_context():
+        print("🔄 Resetting database...")
+
         try:
             # Drop all tables and recreate them with new schema
             print("\n1. Recreating database schema...")
             db.drop_all()
             db.create_all()
+            for version, description, _ in MIGRATIONS:
+                record_version(version, description)
             print("   ✅ Database schema recreated with all new tables and columns")
-            
-            # Create a default company for testing
-            from app import Company, User
-            from werkzeug.security import generate_password_hash
-            
+
             print("\n2. Creating default test data...")
-            
-            # Create default company
-            company = Company(name="Dayflow Technologies", code="DT")
-            db.session.add(company)
-            db.session.flush()
-            
-            # Create admin user
-            admin_user = User(
-                login_id="DTAD20241001",
-                email="admin@dayflow.com",
-                password_hash=generate_password_hash("admin123"),
-                first_name="Admin",
-                last_name="User",
-                role="admin",
-                company_id=company.id,
-                department="IT",
-                position="System Administrator",
-                must_change_password=False
-            )
-            db.session.add(admin_user)
-            
-            # Create test employee
-            employee_user = User(
-                login_id="DTEM20241001",
-                email="employee@dayflow.com",
-                password_hash=generate_password_hash("emp123"),
-                first_name="Test",
-                last_name="Employee",
-                role="employee",
-                company_id=company.id,
-                department="Development",
-                position="Software Developer",
-                must_change_password=False
-            )
-            db.session.add(employee_user)
-            
-            db.session.commit()
-            
-            print("   ✅ Default admin user created: DTAD20241001 / admin123")
-            print("   ✅ Default employee user created: DTEM20241001 / emp123")
-            
-            print("\n✅ Database migration completed successfully!")
-            print("\n📋 Migration Summary:")
-            print("   - Recreated database with comprehensive profile schema")
-            print("   - User table includes: location, about, job_motivation, interests_hobbies")
-            print("   - ProfileDetails table for personal and bank information")
-            print("   - UserSkill table for skills management")
-            print("   - UserCertification table for certifications management")
-            print("   - All foreign key relationships established")
-            print("   - Default test users created for immediate testing")
-            
+            create_default_data()
+
+            print("\n✅ Database reset completed successfully!")
+
         except Exception as e:
-            print(f"\n❌ Migration failed: {e}")
+            print(f"\n❌ Reset failed: {e}")
             db.session.rollback()
 
 if __name__ == "__main__":
-    migrate_database()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Dayflow HRMS database migrations')
+    parser.add_argument('--reset', action='store_true',
+                        help='drop all tables and recreate them with default test data')
+    args = parser.parse_args()
+
+    if args.reset:
+        reset_database()
+    else:
+        upgrade_database()
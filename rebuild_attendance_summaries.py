@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Rebuild the attendance summary tables from raw attendance records
+
+The summaries are kept up to date by check-in, check-out and leave approval.
+Run this after importing or correcting attendance data directly in the database.
+"""
+
+import sys
+import os
+import argparse
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, rebuild_attendance_summaries
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Rebuild attendance summary tables')
+    parser.add_argument('--company', type=int, help='only rebuild this company id')
+    args = parser.parse_args()
+
+    with app.app_context():
+        print("🔄 Rebuilding attendance summaries...")
+        monthly, daily = rebuild_attendance_summaries(args.company)
+        print(f"✅ Rebuilt {monthly} monthly and {daily} daily summary rows")
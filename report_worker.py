@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Run queued custom report jobs outside the web workers
+
+Web processes run jobs on their own threads unless REPORT_JOB_WORKERS=0.
+Run this instead (or alongside) to keep long reports off the web servers,
+or to pick up jobs left queued when a web process restarted. Each poll also
+requeues jobs stuck running past REPORT_JOB_TIMEOUT_SECONDS and deletes jobs
+older than REPORT_JOB_RETENTION_HOURS with their result files.
+"""
+
+import sys
+import os
+import time
+import argparse
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import run_queued_report_jobs
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Run queued report jobs')
+    parser.add_argument('--once', action='store_true', help='run the jobs queued now and exit')
+    parser.add_argument('--interval', type=float, default=5.0,
+                        help='seconds to wait between polls when the queue is empty')
+    args = parser.parse_args()
+
+    print("🔄 Waiting for report jobs..." if not args.once else "🔄 Running queued report jobs...")
+    while True:
+        count = run_queued_report_jobs()
+        if count:
+            print(f"✅ Ran {count} report job(s)")
+        if args.once:
+            break
+        if not count:
+            time.sleep(args.interval)
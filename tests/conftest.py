@@ -0,0 +1,65 @@
+import os
+import sys
+import tempfile
+from datetime import date
+
+import pytest
+
+# app.py reads its configuration at import time; point it at a throwaway SQLite database
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='dayflow-tests-'), 'test.db')
+os.environ.pop('REPORTS_DATABASE_URL', None)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from werkzeug.security import generate_password_hash
+
+import app as dayflow
+
+PASSWORD = 'password'
+# Cheap hash so creating many users stays fast
+PASSWORD_HASH = generate_password_hash(PASSWORD, method='pbkdf2:sha256:1000')
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setitem(dayflow.app.config, 'TESTING', True)
+    # Ids restart in every test's fresh schema, so per-process caches must start empty too
+    monkeypatch.setattr(dayflow, 'presence_board', dayflow.PresenceBoard())
+    dayflow.identity_cache.clear()
+    dayflow.report_cache.clear()
+    with dayflow.app.app_context():
+        dayflow.db.create_all()
+        yield dayflow.app
+        dayflow.db.session.remove()
+        dayflow.db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def make_company(code='DT', name='Dayflow Test'):
+    company = dayflow.Company(name=name, code=code)
+    dayflow.db.session.add(company)
+    dayflow.db.session.flush()
+    return company
+
+
+def make_user(company, login_id, role='employee', date_joined=date(2024, 1, 1), salary=None):
+    """Add a user, with a SalaryInfo when salary is a dict of its columns"""
+    user = dayflow.User(
+        login_id=login_id, email=f'{login_id.lower()}@example.com', password_hash=PASSWORD_HASH,
+        first_name=login_id, last_name='Test', role=role, company_id=company.id,
+        date_joined=date_joined, must_change_password=False
+    )
+    dayflow.db.session.add(user)
+    dayflow.db.session.flush()
+    if salary is not None:
+        dayflow.db.session.add(dayflow.SalaryInfo(employee_id=user.id, **salary))
+    return user
+
+
+def login(client, user):
+    response = client.post('/login', data={'login_id': user.login_id, 'password': PASSWORD})
+    assert response.status_code == 302
+    return response
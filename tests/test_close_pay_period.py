@@ -0,0 +1,59 @@
+from datetime import date
+
+import pytest
+
+import app as dayflow
+from conftest import make_company, make_user
+from test_pay_run import GROSS, MONTH, NET, SALARY, attend, weekdays
+
+
+@pytest.fixture
+def payslip_store(app, tmp_path, monkeypatch):
+    monkeypatch.setitem(app.config, 'PAYSLIP_STORE_FOLDER', str(tmp_path))
+    return tmp_path
+
+
+def close(company, user):
+    dayflow.db.session.commit()
+    pay_run = dayflow.close_pay_period(company.id, MONTH, user.id)
+    dayflow.db.session.commit()
+    return {payslip.login_id: payslip for payslip in dayflow.Payslip.query.filter_by(pay_run_id=pay_run.id)}
+
+
+def test_closed_payslips_snapshot_prorated_net(app, payslip_store):
+    company = make_company()
+    admin = make_user(company, 'DTAD20250001', role='admin')
+    employee = make_user(company, 'DTEM20250001', salary=SALARY)
+    joiner = make_user(company, 'DTEM20250002', date_joined=date(2025, 9, 25), salary=SALARY)
+    attend(employee, weekdays(MONTH, date(2025, 9, 30)))
+    attend(joiner, weekdays(date(2025, 9, 25), date(2025, 9, 30)))
+
+    payslips = close(company, admin)
+
+    assert payslips['DTEM20250001'].net_pay == pytest.approx(NET)
+    assert payslips['DTEM20250001'].unpaid_days == 0
+    assert payslips['DTEM20250002'].net_pay == pytest.approx(NET - GROSS * 18 / 22)
+    assert (payslips['DTEM20250002'].payable_days, payslips['DTEM20250002'].unpaid_days) == (4, 18)
+    document = payslip_store / payslips['DTEM20250002'].document[:2] / f"{payslips['DTEM20250002'].document}.html"
+    assert '4 of 22' in document.read_text()
+
+
+def test_close_reads_the_primary_not_the_reports_replica(app, payslip_store, monkeypatch):
+    company = make_company()
+    admin = make_user(company, 'DTAD20250001', role='admin')
+    employee = make_user(company, 'DTEM20250001', salary=SALARY)
+    attend(employee, weekdays(MONTH, date(2025, 9, 30)))
+
+    def lagging_replica():
+        raise AssertionError('close_pay_period read from the reports replica')
+    monkeypatch.setattr(dayflow, 'reports_session', lagging_replica)
+
+    assert close(company, admin)['DTEM20250001'].net_pay == pytest.approx(NET)
+
+
+def test_months_that_have_not_ended_cannot_be_closed(app, payslip_store):
+    company = make_company()
+    admin = make_user(company, 'DTAD20250001', role='admin')
+
+    with pytest.raises(ValueError, match='has not ended yet'):
+        dayflow.close_pay_period(company.id, date.today().replace(day=1), admin.id)
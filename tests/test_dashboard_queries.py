@@ -0,0 +1,56 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import event
+
+import app as dayflow
+from conftest import login, make_company, make_user
+
+
+def add_employees(company_id, count):
+    company = dayflow.db.session.get(dayflow.Company, company_id)
+    start = dayflow.User.query.filter_by(company_id=company_id).count()
+    for n in range(start, start + count):
+        employee = make_user(company, f'DTEM2025{n:04d}')
+        if n % 2:
+            dayflow.db.session.add(dayflow.Attendance(
+                employee_id=employee.id, date=date.today(), check_in=datetime.now(), status='present'
+            ))
+    dayflow.db.session.commit()
+
+
+def dashboard_queries(client, company_id, rebuild_presence):
+    """Statements run by one /dashboard render, optionally rebuilding the presence board"""
+    if rebuild_presence:
+        dayflow.presence_board.invalidate(company_id)
+    # The request shares the test's app context; give it a fresh session like a real request
+    dayflow.db.session.remove()
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(dayflow.db.engine, 'before_cursor_execute', count)
+    try:
+        response = client.get('/dashboard')
+    finally:
+        event.remove(dayflow.db.engine, 'before_cursor_execute', count)
+    assert response.status_code == 200
+    return len(statements)
+
+
+@pytest.mark.parametrize('rebuild_presence', [True, False])
+@pytest.mark.parametrize('role', ['admin', 'hr'])
+def test_dashboard_query_count_does_not_grow_with_employees(app, client, role, rebuild_presence):
+    company = make_company()
+    user = make_user(company, 'DTAD20250001', role=role)
+    company_id = company.id
+    add_employees(company_id, 5)
+    login(client, user)
+    client.get('/dashboard')
+
+    small = dashboard_queries(client, company_id, rebuild_presence)
+    add_employees(company_id, 45)
+    large = dashboard_queries(client, company_id, rebuild_presence)
+
+    assert small == large
@@ -0,0 +1,84 @@
+from datetime import date, timedelta
+
+import pytest
+
+import app as dayflow
+from conftest import make_company, make_user
+
+# September 2025 starts on a Monday and has 22 weekdays
+MONTH = date(2025, 9, 1)
+SALARY = {'basic_salary': 20000.0, 'hra': 8000.0, 'standard_allowance': 2000.0, 'pf_employee': 1800.0}
+GROSS = 30000.0
+NET = GROSS - 1800.0
+
+
+def attend(employee, days, status='present'):
+    dayflow.db.session.add_all(
+        dayflow.Attendance(employee_id=employee.id, date=day, status=status) for day in days
+    )
+
+
+def weekdays(start, end):
+    return [start + timedelta(days=n) for n in range((end - start).days + 1)
+            if (start + timedelta(days=n)).weekday() < 5]
+
+
+def pay_run(company):
+    dayflow.db.session.commit()
+    working_days, rows = dayflow.query_pay_run(company.id, MONTH)
+    return working_days, {row.login_id: row for row in rows}
+
+
+def test_full_attendance_on_weekdays_is_paid_in_full(app):
+    company = make_company()
+    employee = make_user(company, 'DTEM20250001', salary=SALARY)
+    attend(employee, weekdays(MONTH, date(2025, 9, 30)))
+
+    working_days, rows = pay_run(company)
+
+    # Without WORKING_WEEKDAYS weekends are not working days of a pay run
+    assert working_days == 22
+    row = rows['DTEM20250001']
+    assert row.payable_days == 22
+    assert row.unpaid_days == 0
+    assert row.net_pay == pytest.approx(NET)
+
+
+def test_mid_month_joiner_is_not_paid_for_days_before_joining(app):
+    company = make_company()
+    joiner = make_user(company, 'DTEM20250002', date_joined=date(2025, 9, 25), salary=SALARY)
+    attend(joiner, weekdays(date(2025, 9, 25), date(2025, 9, 30)))
+
+    working_days, rows = pay_run(company)
+
+    row = rows['DTEM20250002']
+    assert (row.payable_days, row.unpaid_days) == (4, 18)
+    assert row.loss_of_pay == pytest.approx(GROSS * 18 / 22)
+    assert row.net_pay == pytest.approx(NET - GROSS * 18 / 22)
+
+
+def test_overlapping_unpaid_leaves_are_deducted_once(app):
+    company = make_company()
+    employee = make_user(company, 'DTEM20250003', salary=SALARY)
+    leave_days = [date(2025, 9, 15), date(2025, 9, 16)]
+    attend(employee, [day for day in weekdays(MONTH, date(2025, 9, 30)) if day not in leave_days])
+    attend(employee, leave_days, status='leave')
+    for start, end, duration in ((date(2025, 9, 15), date(2025, 9, 16), 'full_day'),
+                                 (date(2025, 9, 16), date(2025, 9, 16), 'half_day')):
+        dayflow.db.session.add(dayflow.LeaveRequest(
+            employee_id=employee.id, leave_type='unpaid', start_date=start, end_date=end,
+            duration=duration, status='approved'
+        ))
+
+    _, rows = pay_run(company)
+
+    assert rows['DTEM20250003'].unpaid_days == 2
+
+
+def test_employees_joining_after_the_month_are_left_out(app):
+    company = make_company()
+    make_user(company, 'DTEM20250004', date_joined=date(2025, 10, 6), salary=SALARY)
+
+    _, rows = pay_run(company)
+
+    assert 'DTEM20250004' not in rows
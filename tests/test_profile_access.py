@@ -0,0 +1,38 @@
+import pytest
+
+import app as dayflow
+from conftest import login, make_company, make_user
+
+SALARY = {'basic_salary': 20000.0, 'hra': 8000.0}
+
+
+@pytest.fixture
+def companies(app):
+    home, other = make_company('DT'), make_company('OT', 'Other Test')
+    users = {
+        'admin': make_user(home, 'DTAD20250001', role='admin'),
+        'colleague': make_user(home, 'DTEM20250001', salary=SALARY),
+        'outsider': make_user(other, 'OTEM20250001', salary=SALARY),
+    }
+    dayflow.db.session.commit()
+    return {name: user.id for name, user in users.items()}, users['admin']
+
+
+@pytest.mark.parametrize('tab', ['private', 'salary', 'certifications'])
+def test_profile_tabs_are_scoped_to_the_company(client, companies, tab):
+    ids, admin = companies
+    login(client, admin)
+
+    assert client.get(f"/profile/{ids['colleague']}/tab/{tab}").status_code == 200
+    assert client.get(f"/profile/{ids['outsider']}/tab/{tab}").status_code == 404
+
+
+def test_profile_page_is_scoped_to_the_company(client, companies):
+    ids, admin = companies
+    login(client, admin)
+
+    assert client.get(f"/profile/{ids['colleague']}").status_code == 200
+    assert client.get(f"/profile/{ids['outsider']}").status_code == 404
+    response = client.post(f"/profile/{ids['outsider']}", data={'tab': 'overview', 'phone': '555'})
+    assert response.status_code == 404
+    assert dayflow.db.session.get(dayflow.User, ids['outsider']).phone is None